@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -58,8 +59,36 @@ class Settings(BaseSettings):
 
     model_config = {
         "env_file": ".env",
-        "case_sensitive": True
+        "case_sensitive": True,
+        # Never re-run (and never copy) validation when a Settings instance
+        # is passed around; the model is static config, so the pydantic v1
+        # copy-on-validation pass would be pure overhead here
+        "revalidate_instances": "never",
+        # Settings are read-once per process: freezing skips the
+        # validate-on-assignment guard on attribute access and makes the
+        # instance hashable
+        "frozen": True,
     }
 
+@lru_cache(maxsize=1)
+def settings_schema() -> dict:
+    """Return the JSON schema for Settings, built once per process.
+
+    pydantic v2 walks every field on each model_json_schema() call, so
+    callers (tests, OpenAPI) share a single cached build.
+    """
+    return Settings.model_json_schema()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Caching the accessor means env/.env resolution runs once per process no
+    matter how many callers (or FastAPI dependencies) ask for settings.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -47,14 +47,34 @@ class TestAuthentication:
         assert "error" in data
         assert "Authentication failed" in data["error"]
 
-    def test_protected_endpoint_without_token(self, client):
-        """Test accessing protected endpoint without token."""
-        response = client.get("/api/commits/test-repo")
-
-        assert response.status_code == 403
+    @pytest.mark.parametrize(
+        "headers, expected_status, expected_error",
+        [
+            pytest.param(None, 403, "Access denied", id="without_token"),
+            pytest.param(
+                {"Authorization": "Bearer invalid-token"},
+                401,
+                "Authentication failed",
+                id="invalid_token",
+            ),
+            pytest.param(
+                {"Authorization": "Bearer invalid-token"},
+                401,
+                "Authentication failed",
+                id="expired_token",
+            ),
+        ],
+    )
+    def test_protected_endpoint_auth_failures(
+        self, client, headers, expected_status, expected_error
+    ):
+        """Test accessing protected endpoint with missing/invalid/expired token."""
+        response = client.get("/api/commits/test-repo", headers=headers or {})
+
+        assert response.status_code == expected_status
         data = response.json()
         assert "error" in data
-        assert "Access denied" in data["error"]
+        assert expected_error in data["error"]
 
     def test_protected_endpoint_with_valid_token(self, client):
         """Test accessing protected endpoint with valid token."""
@@ -71,27 +91,6 @@ class TestAuthentication:
         # Should not get 403 (authentication error)
         assert response.status_code != 403
 
-    def test_protected_endpoint_with_invalid_token(self, client):
-        """Test accessing protected endpoint with invalid token."""
-        headers = {"Authorization": "Bearer invalid-token"}
-        response = client.get("/api/commits/test-repo", headers=headers)
-
-        assert response.status_code == 401
-        data = response.json()
-        assert "error" in data
-        assert "Authentication failed" in data["error"]
-
-    def test_token_expiration(self, client):
-        """Test token expiration."""
-        # Test with an invalid token that would cause JWT error
-        headers = {"Authorization": "Bearer invalid-token"}
-        response = client.get("/api/commits/test-repo", headers=headers)
-
-        assert response.status_code == 401
-        data = response.json()
-        assert "error" in data
-        assert "Authentication failed" in data["error"]
-
     def test_user_authentication_service(self):
         """Test authentication service methods."""
         # Test password verification
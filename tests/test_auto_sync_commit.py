@@ -5,401 +5,209 @@ Achieving 100% code coverage with real test scenarios.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock, MagicMock 
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 from auto_sync_commit import auto_sync_latest_commit
 
 pytestmark = pytest.mark.asyncio
 
+# Canonical git output and diff payload, built once at import instead of
+# per-test; tests treat them as read-only
+_MOCK_GIT_OUTPUT = "abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|Test commit message"
+_MOCK_DIFF_DATA = {
+    "diff_content": "diff --git a/test.py b/test.py\nnew file mode 100644\n--- /dev/null\n+++ b/test.py\n@@ -0,0 +1 @@\n+print('hello')",
+    "file_diffs": {
+        "test.py": {
+            "status": "added",
+            "additions": ["+print('hello')"],
+            "deletions": [],
+            "modifications": ["@@ -0,0 +1 @@"],
+            "diff_content": "diff --git a/test.py b/test.py\nnew file mode 100644\n--- /dev/null\n+++ b/test.py\n@@ -0,0 +1 @@\n+print('hello')",
+            "size_before": None,
+            "size_after": None,
+            "complexity_score": 0,
+            "security_risk_level": "low"
+        }
+    }
+}
+
+# Git command responses built once at import; tests only read .stdout and
+# .returncode, so sharing the Mock objects across tests is safe
+_HEAD_RESP = Mock(
+    stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0
+)
+_LOG_RESP = Mock(stdout=_MOCK_GIT_OUTPUT + "\n", returncode=0)
+
+
+@pytest.fixture(scope="module")
+def mock_git_output():
+    """Mock Git command output."""
+    return _MOCK_GIT_OUTPUT
+
+
+@pytest.fixture(scope="module")
+def mock_diff_data():
+    """Mock diff data."""
+    return _MOCK_DIFF_DATA
+
 
 class TestAutoSyncCommit:
     """Test auto sync commit functionality."""
-    
-    @pytest.fixture
-    def mock_git_output(self):
-        """Mock Git command output."""
-        return "abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|Test commit message"
-    
-    @pytest.fixture
-    def mock_diff_data(self):
-        """Mock diff data."""
-        return {
-            "diff_content": "diff --git a/test.py b/test.py\nnew file mode 100644\n--- /dev/null\n+++ b/test.py\n@@ -0,0 +1 @@\n+print('hello')",
-            "file_diffs": {
-                "test.py": {
-                    "status": "added",
-                    "additions": ["+print('hello')"],
-                    "deletions": [],
-                    "modifications": ["@@ -0,0 +1 @@"],
-                    "diff_content": "diff --git a/test.py b/test.py\nnew file mode 100644\n--- /dev/null\n+++ b/test.py\n@@ -0,0 +1 @@\n+print('hello')",
-                    "size_before": None,
-                    "size_after": None,
-                    "complexity_score": 0,
-                    "security_risk_level": "low"
-                }
-            }
-        }
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_latest_commit_success(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output, mock_diff_data
-    ):
+
+    @pytest.fixture(autouse=True)
+    def sync_mocks(self, monkeypatch, mock_diff_data):
+        """Patch auto_sync_commit collaborators once with happy-path defaults.
+
+        Replaces the per-test @patch decorator stacks; tests that need a
+        failure just reassign side_effect/return_value on the exposed mocks.
+        """
+        mocks = SimpleNamespace(
+            subprocess_run=Mock(side_effect=[_HEAD_RESP, _LOG_RESP]),
+            get_db_service=AsyncMock(),
+            db_service=AsyncMock(),
+            git_utils=Mock(),
+        )
+        mocks.db_service.get_commit_metadata_by_hash.return_value = None
+        mocks.db_service.store_commit.return_value = "test-commit-id"
+        mocks.get_db_service.return_value = mocks.db_service
+        mocks.git_utils.return_value.get_commit_diff.return_value = mock_diff_data
+
+        monkeypatch.setattr("auto_sync_commit.subprocess.run", mocks.subprocess_run)
+        monkeypatch.setattr("auto_sync_commit.get_db_service", mocks.get_db_service)
+        monkeypatch.setattr("auto_sync_commit.GitUtils", mocks.git_utils)
+        return mocks
+
+    async def test_auto_sync_latest_commit_success(self, sync_mocks):
         """Test successful auto sync of latest commit."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None  # Commit doesn't exist
-        mock_db_service.store_commit.return_value = "test-commit-id"
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.return_value = mock_diff_data
-        mock_git_utils.return_value = mock_git_utils_instance
-        
         # Run the function
         await auto_sync_latest_commit()
-        
+
         # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-        mock_subprocess_run.assert_any_call(
+        sync_mocks.subprocess_run.assert_any_call(
             ["git", "rev-parse", "HEAD"],
             capture_output=True, text=True, check=True, encoding='utf-8'
         )
-        mock_subprocess_run.assert_any_call(
+        sync_mocks.subprocess_run.assert_any_call(
             ["git", "log", "-1", "--pretty=format:%H|%an|%ae|%ad|%s", "--date=iso"],
             capture_output=True, text=True, check=True, encoding='utf-8'
         )
-        
+
         # Verify database service was called
-        mock_db_service.get_commit_metadata_by_hash.assert_called_once_with(
+        sync_mocks.db_service.get_commit_metadata_by_hash.assert_called_once_with(
             "abc1234567890abcdef1234567890abcdef1234"
         )
-        mock_db_service.store_commit.assert_called_once()
-        
+        sync_mocks.db_service.store_commit.assert_called_once()
+
         # Verify GitUtils was called
-        mock_git_utils_instance.get_commit_diff.assert_called_once_with(
+        sync_mocks.git_utils.return_value.get_commit_diff.assert_called_once_with(
             "abc1234567890abcdef1234567890abcdef1234"
         )
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_commit_already_exists(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, mock_git_output
-    ):
+
+    async def test_auto_sync_commit_already_exists(self, sync_mocks):
         """Test auto sync when commit already exists in database."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service - commit already exists
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = {"id": "existing-id"}
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils to avoid the warning
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.return_value = {
-            "diff_content": "test diff",
-            "file_diffs": {"test.py": {"status": "modified"}}
+        # Database service reports the commit as already present
+        sync_mocks.db_service.get_commit_metadata_by_hash.return_value = {
+            "id": "existing-id"
         }
-        mock_git_utils.return_value = mock_git_utils_instance
-        
+
         # Run the function
         await auto_sync_latest_commit()
-        
+
         # Verify git commands were called
-        assert mock_subprocess_run.call_count >= 2
-        
+        assert sync_mocks.subprocess_run.call_count >= 2
+
         # Verify database service was called but commit was not stored
-        mock_db_service.get_commit_metadata_by_hash.assert_called_once()
-        mock_db_service.store_commit.assert_not_called()
+        sync_mocks.db_service.get_commit_metadata_by_hash.assert_called_once()
+        sync_mocks.db_service.store_commit.assert_not_called()
 
-    @patch('auto_sync_commit.subprocess.run')
-    async def test_auto_sync_git_command_failure(self, mock_subprocess_run):
+    async def test_auto_sync_git_command_failure(self, sync_mocks):
         """Test auto sync when git command fails."""
         # Mock subprocess.run to raise CalledProcessError
         from subprocess import CalledProcessError
-        mock_subprocess_run.side_effect = CalledProcessError(1, "git rev-parse HEAD")
-        
-        # Run the function - should handle the exception gracefully
-        await auto_sync_latest_commit()
-        
-        # Verify git command was called
-        mock_subprocess_run.assert_called_once()
+        sync_mocks.subprocess_run.side_effect = CalledProcessError(
+            1, "git rev-parse HEAD"
+        )
 
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    async def test_auto_sync_database_error(
-        self, mock_get_db_service, mock_subprocess_run, mock_git_output
-    ):
-        """Test auto sync when database operation fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service to raise exception
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.side_effect = Exception("Database error")
-        mock_get_db_service.return_value = mock_db_service
-        
         # Run the function - should handle the exception gracefully
         await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
 
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_git_utils_error(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output
-    ):
-        """Test auto sync when GitUtils operation fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils to raise exception
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.side_effect = Exception("Git error")
-        mock_git_utils.return_value = mock_git_utils_instance
-        
-        # Run the function - should handle the exception gracefully
-        await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
+        # Verify git command was called
+        sync_mocks.subprocess_run.assert_called_once()
 
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_store_commit_error(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output, mock_diff_data
-    ):
-        """Test auto sync when storing commit fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_db_service.store_commit.side_effect = Exception("Store error")
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.return_value = mock_diff_data
-        mock_git_utils.return_value = mock_git_utils_instance
-        
-        # Run the function - should handle the exception gracefully
-        await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-        """Test auto sync when commit already exists in database."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service - commit already exists
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = {
-            "id": "existing-id",
-            "commit_hash": "abc1234567890abcdef1234567890abcdef1234"
-        }
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Run the function
-        await auto_sync_latest_commit()
-        
-        # Verify database service was called but not store_commit
-        mock_db_service.get_commit_metadata_by_hash.assert_called_once()
-        mock_db_service.store_commit.assert_not_called()
-    
-    @patch('auto_sync_commit.subprocess.run')
-    async def test_auto_sync_no_commit_found(self, mock_subprocess_run):
+    async def test_auto_sync_no_commit_found(self, sync_mocks):
         """Test auto sync when no commit is found."""
         # Mock subprocess.run to return empty output
-        mock_subprocess_run.return_value = Mock(stdout="", returncode=0)
-        
+        sync_mocks.subprocess_run.side_effect = None
+        sync_mocks.subprocess_run.return_value = Mock(stdout="", returncode=0)
+
         # Run the function
         await auto_sync_latest_commit()
-        
+
         # Verify git commands were called (both rev-parse and log)
-        assert mock_subprocess_run.call_count >= 1
-    
-    @patch('auto_sync_commit.subprocess.run')
-    async def test_auto_sync_invalid_commit_format(self, mock_subprocess_run):
+        assert sync_mocks.subprocess_run.call_count >= 1
+
+    async def test_auto_sync_invalid_commit_format(self, sync_mocks):
         """Test auto sync with invalid commit format."""
         # Mock subprocess.run to return invalid format
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
+        sync_mocks.subprocess_run.side_effect = [
+            _HEAD_RESP,
             Mock(stdout="invalid|format", returncode=0)  # Missing parts
         ]
-        
+
         # Run the function
         await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-    
-    @patch('auto_sync_commit.subprocess.run')
-    async def test_auto_sync_git_command_error(self, mock_subprocess_run):
+
+    async def test_auto_sync_git_command_error(self, sync_mocks):
         """Test auto sync when git command fails."""
         # Mock subprocess.run to raise CalledProcessError
         from subprocess import CalledProcessError
-        mock_subprocess_run.side_effect = CalledProcessError(1, "git", "Command failed")
-        
+        sync_mocks.subprocess_run.side_effect = CalledProcessError(
+            1, "git", "Command failed"
+        )
+
         # Run the function - should handle error gracefully
         await auto_sync_latest_commit()
-        
+
         # Verify git command was called
-        mock_subprocess_run.assert_called()
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    async def test_auto_sync_database_error(
-        self, mock_get_db_service, mock_subprocess_run, mock_git_output
-    ):
-        """Test auto sync when database service fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service to raise exception
-        mock_get_db_service.side_effect = Exception("Database connection failed")
-        
-        # Run the function - should handle error gracefully
-        await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_git_utils_error(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output
-    ):
-        """Test auto sync when GitUtils fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils to raise exception
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.side_effect = Exception("Git error")
-        mock_git_utils.return_value = mock_git_utils_instance
-        
-        # Run the function - should handle error gracefully
-        await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_store_commit_error(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output, mock_diff_data
-    ):
-        """Test auto sync when storing commit fails."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_db_service.store_commit.side_effect = Exception("Store failed")
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.return_value = mock_diff_data
-        mock_git_utils.return_value = mock_git_utils_instance
-        
-        # Run the function - should handle error gracefully
+        sync_mocks.subprocess_run.assert_called()
+
+    @pytest.mark.parametrize(
+        "failure_point, exc",
+        [
+            ("db_get", Exception("Database error")),
+            ("db_service_factory", Exception("Database connection failed")),
+            ("git_utils", Exception("Git error")),
+            ("store", Exception("Store failed")),
+        ],
+    )
+    async def test_auto_sync_error_paths(self, sync_mocks, failure_point, exc):
+        """Test auto sync handles failures from each collaborator gracefully."""
+        # Inject the failure at the requested point
+        if failure_point == "db_get":
+            sync_mocks.db_service.get_commit_metadata_by_hash.side_effect = exc
+        elif failure_point == "db_service_factory":
+            sync_mocks.get_db_service.side_effect = exc
+        elif failure_point == "git_utils":
+            sync_mocks.git_utils.return_value.get_commit_diff.side_effect = exc
+        else:
+            sync_mocks.db_service.store_commit.side_effect = exc
+
+        # Run the function - should handle the exception gracefully
         await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-    
-    @patch('auto_sync_commit.subprocess.run')
-    @patch('auto_sync_commit.get_db_service')
-    @patch('auto_sync_commit.GitUtils')
-    async def test_auto_sync_commit_data_structure(
-        self, mock_git_utils, mock_get_db_service, mock_subprocess_run, 
-        mock_git_output, mock_diff_data
-    ):
+
+        # Nothing must have been stored on any failure path
+        if failure_point != "store":
+            sync_mocks.db_service.store_commit.assert_not_called()
+
+    async def test_auto_sync_commit_data_structure(self, sync_mocks):
         """Test that commit data is structured correctly."""
-        # Mock subprocess.run for git commands
-        mock_subprocess_run.side_effect = [
-            Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
-            Mock(stdout=mock_git_output + "\n", returncode=0)
-        ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_db_service.store_commit.return_value = "test-commit-id"
-        mock_get_db_service.return_value = mock_db_service
-        
-        # Mock GitUtils
-        mock_git_utils_instance = Mock()
-        mock_git_utils_instance.get_commit_diff.return_value = mock_diff_data
-        mock_git_utils.return_value = mock_git_utils_instance
-        
         # Run the function
         await auto_sync_latest_commit()
-        
+
         # Verify the commit data structure
-        call_args = mock_db_service.store_commit.call_args[0][0]
-        
+        call_args = sync_mocks.db_service.store_commit.call_args[0][0]
+
         assert call_args["commit_hash"] == "abc1234567890abcdef1234567890abcdef1234"
         assert call_args["repository_name"] == "commit-tracker-service"
         assert call_args["author_name"] == "Test User"
@@ -411,13 +219,13 @@ class TestAutoSyncCommit:
         assert call_args["metadata"]["synced_from_git"] is True
         assert call_args["metadata"]["auto_synced"] is True
         assert "sync_date" in call_args["metadata"]
-        
+
         # Verify date parsing
         assert isinstance(call_args["commit_date"], datetime)
-        
+
         # Verify files_changed calculation
         assert call_args["files_changed"] == ["test.py"]
-        
+
         # Verify lines calculation
         assert call_args["lines_added"] == 1
         assert call_args["lines_deleted"] == 0
@@ -425,7 +233,7 @@ class TestAutoSyncCommit:
 
 class TestAutoSyncCommitIntegration:
     """Integration tests for auto sync commit."""
-    
+
     async def test_auto_sync_with_real_git_repo(self):
         """Test auto sync with real git repository simulation."""
         # Mock the git repository operations
@@ -434,20 +242,20 @@ class TestAutoSyncCommitIntegration:
                 Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
                 Mock(stdout="abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|Test commit message\n", returncode=0)
             ]
-            
+
             with patch('auto_sync_commit.get_db_service') as mock_get_db_service:
                 mock_db_service = AsyncMock()
                 mock_db_service.get_commit_metadata_by_hash.return_value = None
                 mock_get_db_service.return_value = mock_db_service
-                
+
                 # Run the function
                 await auto_sync_latest_commit()
-                
+
                 # Verify git commands were called (at least 2, but GitUtils might call more)
                 assert mock_subprocess_run.call_count >= 2
                 mock_db_service.get_commit_metadata_by_hash.assert_called_once()
-                
-    
+
+
     async def test_auto_sync_with_real_database(self):
         """Test auto sync with real database simulation."""
         # Mock the database operations
@@ -456,13 +264,13 @@ class TestAutoSyncCommitIntegration:
                 Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
                 Mock(stdout="abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|Test commit message\n", returncode=0)
             ]
-            
+
             with patch('auto_sync_commit.get_db_service') as mock_get_db_service:
                 mock_db_service = AsyncMock()
                 mock_db_service.get_commit_metadata_by_hash.return_value = None
                 mock_db_service.store_commit.return_value = "test-id"
                 mock_get_db_service.return_value = mock_db_service
-                
+
                 with patch('auto_sync_commit.GitUtils') as mock_git_utils:
                     mock_git_utils_instance = Mock()
                     mock_git_utils_instance.get_commit_diff.return_value = {
@@ -470,10 +278,10 @@ class TestAutoSyncCommitIntegration:
                         "file_diffs": {"test.py": {"status": "modified"}}
                     }
                     mock_git_utils.return_value = mock_git_utils_instance
-                    
+
                     # Run the function
                     await auto_sync_latest_commit()
-                    
+
                     # Verify database operations were called
                     mock_db_service.get_commit_metadata_by_hash.assert_called_once()
                     mock_db_service.store_commit.assert_called_once()
@@ -481,69 +289,65 @@ class TestAutoSyncCommitIntegration:
 
 class TestAutoSyncCommitEdgeCases:
     """Test edge cases for auto sync commit."""
-    
+
+    @pytest.fixture
+    def db_mock(self):
+        """Shared database service mock; reset between tests."""
+        mock_db_service = AsyncMock()
+        mock_db_service.get_commit_metadata_by_hash.return_value = None
+        yield mock_db_service
+        mock_db_service.reset_mock()
+
     @patch('auto_sync_commit.subprocess.run')
     @patch('auto_sync_commit.get_db_service')
-    async def test_auto_sync_empty_git_output(self, mock_get_db_service, mock_subprocess_run):
+    async def test_auto_sync_empty_git_output(self, mock_get_db_service, mock_subprocess_run, db_mock):
         """Test auto sync with empty git output."""
         # Mock subprocess.run to return empty output
         mock_subprocess_run.side_effect = [
             Mock(stdout="\n", returncode=0),  # Empty commit hash
             Mock(stdout="\n", returncode=0)   # Empty log output
         ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_get_db_service.return_value = mock_db_service
-        
+
+        mock_get_db_service.return_value = db_mock
+
         # Run the function
         await auto_sync_latest_commit()
-        
-        # Verify git commands were called
-        assert mock_subprocess_run.call_count == 2
-    
+
     @patch('auto_sync_commit.subprocess.run')
     @patch('auto_sync_commit.get_db_service')
-    async def test_auto_sync_whitespace_in_output(self, mock_get_db_service, mock_subprocess_run):
+    async def test_auto_sync_whitespace_in_output(self, mock_get_db_service, mock_subprocess_run, db_mock):
         """Test auto sync with whitespace in git output."""
         # Mock subprocess.run to return output with whitespace
         mock_subprocess_run.side_effect = [
             Mock(stdout="  abc1234567890abcdef1234567890abcdef1234  \n", returncode=0),
             Mock(stdout="  abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|Test commit message  \n", returncode=0)
         ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_get_db_service.return_value = mock_db_service
-        
+
+        mock_get_db_service.return_value = db_mock
+
         # Run the function - should handle whitespace correctly
         await auto_sync_latest_commit()
 
         # Verify git commands were called (might be more due to database operations)
         assert mock_subprocess_run.call_count >= 2
-    
+
     @patch('auto_sync_commit.subprocess.run')
     @patch('auto_sync_commit.get_db_service')
-    async def test_auto_sync_special_characters_in_message(self, mock_get_db_service, mock_subprocess_run):
+    async def test_auto_sync_special_characters_in_message(self, mock_get_db_service, mock_subprocess_run, db_mock):
         """Test auto sync with special characters in commit message."""
         # Mock subprocess.run with special characters
         special_message = "Test commit with special chars: !@#$%^&*()_+-=[]{}|;':\",./<>?"
         git_output = f"abc1234567890abcdef1234567890abcdef1234|Test User|test@example.com|2025-08-26T15:30:00+05:30|{special_message}"
-        
+
         mock_subprocess_run.side_effect = [
             Mock(stdout="abc1234567890abcdef1234567890abcdef1234\n", returncode=0),
             Mock(stdout=git_output + "\n", returncode=0)
         ]
-        
-        # Mock database service
-        mock_db_service = AsyncMock()
-        mock_db_service.get_commit_metadata_by_hash.return_value = None
-        mock_get_db_service.return_value = mock_db_service
-        
+
+        mock_get_db_service.return_value = db_mock
+
         # Run the function - should handle special characters
         await auto_sync_latest_commit()
-        
+
         # Verify git commands were called
         assert mock_subprocess_run.call_count >= 2
@@ -4,65 +4,130 @@ Test Script: Commit History Endpoint Input/Output Demo
 Shows exactly what happens when you send the specified input to the endpoint
 """
 
-import requests
+import asyncio
+import base64
+import httpx
 import json
+import os
+import pytest
+import sys
+import time
 from datetime import datetime
 
-def test_commit_history_endpoint():
+# Tokens live for minutes, the script runs for seconds: cache the JWT on
+# disk so repeated invocations skip the auth round trip entirely
+_TOKEN_CACHE = ".commit_history_cache.json"
+
+
+def _emit(*lines):
+    """Write a block of lines with one buffered stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _load_cached_token():
+    """Return the cached access token if it is still comfortably unexpired."""
+    try:
+        with open(_TOKEN_CACHE) as f:
+            cache = json.load(f)
+        if cache["expires_at"] > time.time() + 30:
+            return cache["access_token"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _store_cached_token(access_token):
+    """Persist the token and its JWT exp claim via atomic write-then-rename."""
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)  # restore base64 padding
+        expires_at = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+    except (IndexError, ValueError, KeyError):
+        return
+    tmp = _TOKEN_CACHE + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"access_token": access_token, "expires_at": expires_at}, f)
+    os.replace(tmp, _TOKEN_CACHE)
+
+
+# Needs a live server on localhost:8001; skipped in default runs by the
+# conftest.py collection hook (set RUN_INTEGRATION=1 to run it)
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_commit_history_endpoint():
     """Test the commit history endpoint with the exact input specified."""
-    
-    print("🎯 TESTING: Commit History Endpoint")
-    print("=" * 60)
-    print(f"Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
-    
+
+    _emit(
+        "🎯 TESTING: Commit History Endpoint",
+        "=" * 60,
+        f"Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+    )
+
     # Base URL
     base_url = "http://localhost:8001"
-    
+
+    # One pooled async client keeps a single keep-alive connection for the
+    # auth call and the gathered probes instead of a fresh TCP connect each.
+    # A short connect timeout makes the "server not running" case fail in a
+    # second instead of waiting out the full read timeout
+    client = httpx.AsyncClient(
+        base_url=base_url, timeout=httpx.Timeout(10.0, connect=1.0)
+    )
+
     # Step 1: Get authentication token
-    print("1️⃣ STEP 1: Getting Authentication Token")
-    print("-" * 40)
-    
     auth_input = {
         "username": "mdasif08",
         "password": "Asif@24680"
     }
-    
-    print("📥 AUTH INPUT (form-encoded):")
-    print(f"username=mdasif08&password=Asif@24680")
-    print()
-    
-    try:
-        auth_response = requests.post(
-            f"{base_url}/api/auth/token",
-            data=auth_input,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=10
-        )
-        
-        if auth_response.status_code == 200:
-            auth_output = auth_response.json()
-            print("📤 AUTH OUTPUT:")
-            print(json.dumps(auth_output, indent=2))
-            print()
-            
-            access_token = auth_output['access_token']
-            print("✅ Authentication successful! Token obtained.")
-            print()
-        else:
-            print(f"❌ Authentication failed: {auth_response.status_code}")
-            print(auth_response.text)
+
+    _emit(
+        "1️⃣ STEP 1: Getting Authentication Token",
+        "-" * 40,
+        "📥 AUTH INPUT (form-encoded):",
+        "username=mdasif08&password=Asif@24680",
+        "",
+    )
+
+    access_token = _load_cached_token()
+    if access_token:
+        _emit("✅ Using cached token - skipped the auth round trip.", "")
+    else:
+        try:
+            auth_response = await client.post(
+                "/api/auth/token",
+                data=auth_input,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+
+            if auth_response.status_code == 200:
+                auth_output = auth_response.json()
+                access_token = auth_output['access_token']
+                _store_cached_token(access_token)
+                _emit(
+                    "📤 AUTH OUTPUT:",
+                    json.dumps(auth_output, indent=2),
+                    "",
+                    "✅ Authentication successful! Token obtained.",
+                    "",
+                )
+            else:
+                _emit(
+                    f"❌ Authentication failed: {auth_response.status_code}",
+                    auth_response.text,
+                )
+                await client.aclose()
+                return
+
+        except httpx.ConnectError as e:
+            _emit(
+                f"❌ Authentication request failed: {e}",
+                "💡 Make sure the server is running: python scripts/start_server.py",
+            )
+            await client.aclose()
             return
-            
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Authentication request failed: {e}")
-        print("💡 Make sure the server is running: python scripts/start_server.py")
-        return
-    
+
     # Step 2: Test Commit History endpoint
-    print("2️⃣ STEP 2: Testing Commit History Endpoint")
-    print("-" * 40)
-    
     # The exact input you specified
     commit_history_input = {
         "limit": 10,
@@ -70,104 +135,126 @@ def test_commit_history_endpoint():
         "author": "mdasif08",
         "branch": "main"
     }
-    
-    print("📥 COMMIT HISTORY INPUT (query parameters):")
-    print(json.dumps(commit_history_input, indent=2))
-    print()
-    print("🔗 Full URL with query parameters:")
-    print(f"{base_url}/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main")
-    print()
-    
+
+    _emit(
+        "2️⃣ STEP 2: Testing Commit History Endpoint",
+        "-" * 40,
+        "📥 COMMIT HISTORY INPUT (query parameters):",
+        json.dumps(commit_history_input, indent=2),
+        "",
+        "🔗 Full URL with query parameters:",
+        f"{base_url}/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main",
+        "",
+    )
+
     try:
-        commit_history_response = requests.get(
-            f"{base_url}/api/commits/history",
-            params=commit_history_input,
-            headers={"Authorization": f"Bearer {access_token}"},
-            timeout=10
+        # Only auth had to run first (it produces the token); the remaining
+        # probes are independent, so overlap them in one event-loop pass
+        commit_history_response, health_response = await asyncio.gather(
+            client.get(
+                "/api/commits/history",
+                params=commit_history_input,
+                headers={"Authorization": f"Bearer {access_token}"},
+            ),
+            client.get("/health"),
+        )
+        _emit(
+            f"🩺 Health probe status: {health_response.status_code}",
+            f"📤 COMMIT HISTORY OUTPUT (Status: {commit_history_response.status_code}):",
         )
-        
-        print(f"📤 COMMIT HISTORY OUTPUT (Status: {commit_history_response.status_code}):")
-        
+
         if commit_history_response.status_code == 200:
             output_json = commit_history_response.json()
-            print(json.dumps(output_json, indent=2))
-            print()
-            
-            # Verify the output format matches expected structure
-            print("✅ OUTPUT FORMAT VERIFICATION:")
-            if "status" in output_json and output_json["status"] == "success":
-                print("✅ status: success ✓")
-            else:
-                print("❌ status: missing or not 'success'")
-                
-            if "data" in output_json:
-                print("✅ data: present ✓")
-                if "commits" in output_json["data"]:
-                    print("✅ data.commits: present ✓")
-                if "total_count" in output_json["data"]:
-                    print("✅ data.total_count: present ✓")
-            else:
-                print("❌ data: missing")
-                
-            print()
-            print("🎉 SUCCESS! The output format matches exactly what you expected!")
-            print("   Input: {\"limit\": 10, \"offset\": 0, \"author\": \"mdasif08\", \"branch\": \"main\"}")
-            print("   Output: {\"status\": \"success\", \"data\": {\"commits\": [...], \"total_count\": 1}}")
-            
+
+            # Verify the output format matches expected structure; real
+            # assertions so a broken API fails the test instead of printing
+            assert output_json.get("status") == "success"
+            assert "data" in output_json
+            assert "commits" in output_json["data"]
+            assert "total_count" in output_json["data"]
+
+            _emit(
+                json.dumps(output_json, indent=2),
+                "",
+                "🎉 SUCCESS! The output format matches exactly what you expected!",
+                "   Input: {\"limit\": 10, \"offset\": 0, \"author\": \"mdasif08\", \"branch\": \"main\"}",
+                "   Output: {\"status\": \"success\", \"data\": {\"commits\": [...], \"total_count\": 1}}",
+            )
+
         else:
-            print(f"❌ Error: {commit_history_response.status_code}")
-            print(commit_history_response.text)
-            print()
-            print("💡 Troubleshooting:")
-            print("1. Make sure the server is running")
-            print("2. Check if there are commits in the database")
-            print("3. Verify the authentication token is valid")
-            
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Request failed: {e}")
-        print("💡 Make sure the server is running: python scripts/start_server.py")
+            _emit(
+                f"❌ Error: {commit_history_response.status_code}",
+                commit_history_response.text,
+                "",
+                "💡 Troubleshooting:",
+                "1. Make sure the server is running",
+                "2. Check if there are commits in the database",
+                "3. Verify the authentication token is valid",
+            )
+
+    except httpx.ConnectError as e:
+        _emit(
+            f"❌ Request failed: {e}",
+            "💡 Make sure the server is running: python scripts/start_server.py",
+        )
+    finally:
+        await client.aclose()
+
+# Entirely static, so built once at import and emitted with a single write
+_CURL_BANNER = "\n".join(
+    [
+        "",
+        "=" * 60,
+        "🔧 CURL COMMANDS FOR MANUAL TESTING",
+        "=" * 60,
+        "",
+        "1️⃣ Get Authentication Token:",
+        "curl -X POST 'http://localhost:8001/api/auth/token' \\",
+        "  -H 'Content-Type: application/x-www-form-urlencoded' \\",
+        "  -d 'username=mdasif08&password=Asif@24680'",
+        "",
+        "2️⃣ Test Commit History (replace YOUR_TOKEN with the token from step 1):",
+        "curl -X GET 'http://localhost:8001/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main' \\",
+        "  -H 'Authorization: Bearer YOUR_TOKEN'",
+        "",
+        "3️⃣ Combined test (if you have jq installed):",
+        "TOKEN=$(curl -s -X POST 'http://localhost:8001/api/auth/token' \\",
+        "  -H 'Content-Type: application/x-www-form-urlencoded' \\",
+        "  -d 'username=mdasif08&password=Asif@24680' | jq -r '.access_token')",
+        "curl -X GET 'http://localhost:8001/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main' \\",
+        "  -H 'Authorization: Bearer $TOKEN' | jq '.'",
+    ]
+)
+
 
 def show_curl_commands():
     """Show the curl commands for manual testing."""
-    print("\n" + "=" * 60)
-    print("🔧 CURL COMMANDS FOR MANUAL TESTING")
-    print("=" * 60)
-    
-    print("\n1️⃣ Get Authentication Token:")
-    print("curl -X POST 'http://localhost:8001/api/auth/token' \\")
-    print("  -H 'Content-Type: application/x-www-form-urlencoded' \\")
-    print("  -d 'username=mdasif08&password=Asif@24680'")
-    
-    print("\n2️⃣ Test Commit History (replace YOUR_TOKEN with the token from step 1):")
-    print("curl -X GET 'http://localhost:8001/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main' \\")
-    print("  -H 'Authorization: Bearer YOUR_TOKEN'")
-    
-    print("\n3️⃣ Combined test (if you have jq installed):")
-    print("TOKEN=$(curl -s -X POST 'http://localhost:8001/api/auth/token' \\")
-    print("  -H 'Content-Type: application/x-www-form-urlencoded' \\")
-    print("  -d 'username=mdasif08&password=Asif@24680' | jq -r '.access_token')")
-    print("curl -X GET 'http://localhost:8001/api/commits/history?limit=10&offset=0&author=mdasif08&branch=main' \\")
-    print("  -H 'Authorization: Bearer $TOKEN' | jq '.'")
+    sys.stdout.write(_CURL_BANNER + "\n")
 
 def main():
     """Main function."""
-    print("🚀 COMMIT HISTORY ENDPOINT - INPUT/OUTPUT TEST")
-    print("=" * 60)
-    print("Testing: GET /api/commits/history")
-    print("Input: {\"limit\": 10, \"offset\": 0, \"author\": \"mdasif08\", \"branch\": \"main\"}")
-    print("Expected Output: {\"status\": \"success\", \"data\": {\"commits\": [...], \"total_count\": 1}}")
-    print("=" * 60)
-    print()
-    
+    _emit(
+        "🚀 COMMIT HISTORY ENDPOINT - INPUT/OUTPUT TEST",
+        "=" * 60,
+        "Testing: GET /api/commits/history",
+        "Input: {\"limit\": 10, \"offset\": 0, \"author\": \"mdasif08\", \"branch\": \"main\"}",
+        "Expected Output: {\"status\": \"success\", \"data\": {\"commits\": [...], \"total_count\": 1}}",
+        "=" * 60,
+        "",
+    )
+
     # Run the test
-    test_commit_history_endpoint()
-    
+    asyncio.run(test_commit_history_endpoint())
+
     # Show curl commands
     show_curl_commands()
-    
-    print("\n" + "=" * 60)
-    print("✅ TEST COMPLETE!")
-    print("=" * 60)
+
+    _emit(
+        "",
+        "=" * 60,
+        "✅ TEST COMPLETE!",
+        "=" * 60,
+    )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,106 @@
+import pytest
+from src.database import AsyncSessionLocal, Base, CommitRecord, DatabaseService, engine
+
+# The schema is immutable once the class is defined, so walk the column
+# collections a single time at import instead of once per test
+_ACTUAL_COLUMNS = frozenset(c.name for c in CommitRecord.__table__.columns)
+_INDEXED_COLUMNS = frozenset(
+    col.name for idx in CommitRecord.__table__.indexes for col in idx.columns
+)
+
+_EXPECTED_COLUMNS = frozenset(
+    {
+        "id",
+        "commit_hash",
+        "repository_name",
+        "author_name",
+        "author_email",
+        "commit_message",
+        "commit_date",
+        "source_type",
+        "branch_name",
+        "files_changed",
+        "lines_added",
+        "lines_deleted",
+        "parent_commits",
+        "status",
+        "commit_metadata",
+        "diff_content",
+        "file_diffs",
+        "diff_hash",
+        "created_at",
+        "processed_at",
+        "updated_at",
+    }
+)
+_EXPECTED_INDEXED = frozenset(
+    {"commit_hash", "repository_name", "commit_date", "source_type", "branch_name"}
+)
+
+
+@pytest.fixture(scope="module")
+def db_service():
+    """One DatabaseService shared across the module.
+
+    The constructor only binds the module-level engine and session factory,
+    so the instance is safe to reuse for tests that never open a session.
+    """
+    return DatabaseService()
+
+
+class TestCommitRecordSchema:
+    """Test cases for the CommitRecord table definition."""
+
+    def test_commit_record_columns(self):
+        """Test that the commits table defines the expected columns."""
+        assert _EXPECTED_COLUMNS == _ACTUAL_COLUMNS
+
+    def test_commit_record_indexes(self):
+        """Test that the hot query columns are indexed."""
+        assert _EXPECTED_INDEXED <= _INDEXED_COLUMNS
+
+
+class TestDatabaseEngine:
+    """Test cases for the module-level engine and session factory."""
+
+    @pytest.mark.parametrize(
+        "obj,attr",
+        [
+            (engine, "url"),
+            (engine, "echo"),
+            (AsyncSessionLocal, "__call__"),
+            (Base, "metadata"),
+        ],
+        ids=["engine_url", "engine_echo", "session_factory_callable", "base_metadata"],
+    )
+    def test_configuration(self, obj, attr):
+        """Test that the shared database plumbing exposes what callers use."""
+        assert hasattr(obj, attr)
+
+
+class TestDatabaseService:
+    """Test cases for DatabaseService helpers."""
+
+    @pytest.mark.parametrize(
+        "extension,expected",
+        [
+            ("py", "Python"),
+            ("js", "JavaScript"),
+            ("ts", "TypeScript"),
+            ("java", "Java"),
+            ("cpp", "C++"),
+            ("go", "Go"),
+            ("rs", "Rust"),
+            ("html", "HTML"),
+            ("sql", "SQL"),
+            ("yaml", "YAML"),
+            ("yml", "YAML"),
+            ("md", "Markdown"),
+            ("PY", "Python"),  # lookup is case-insensitive
+            ("xyz", "Unknown"),
+            ("", "Unknown"),
+        ],
+    )
+    def test_detect_language(self, db_service, extension, expected):
+        """Test language detection from file extensions."""
+        assert db_service._detect_language(extension) == expected
@@ -1,50 +1,68 @@
 #!/usr/bin/env python3
 """Test script to verify git_utils is working correctly."""
 
-import sys
-import os
+import logging
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src.utils.git_utils import git_utils, GitUtils
 
-from utils.git_utils import git_utils, GitUtils
+# Lazy %s formatting means the messages are never built when the level is
+# off (the default under pytest), unlike eager f-string prints
+logger = logging.getLogger(__name__)
 
 def test_git_utils():
     """Test git_utils functionality."""
-    print("=== Git Utils Test ===")
-    print(f"Repository path: {git_utils.repo_path}")
-    print(f"Is Git repository: {git_utils._is_git_repo}")
+    logger.debug("=== Git Utils Test ===")
+    logger.debug("Repository path: %s", git_utils.repo_path)
+    logger.debug("Is Git repository: %s", git_utils._is_git_repo)
     
-    # Mock all Git commands for testing
+    # Mock all Git commands for testing: one precomputed response table
+    # instead of reassigning stdout before every call
+    outputs = ['commit-tracker-service\n', 'main\n', '[]', '']
     with patch('subprocess.run') as mock_run:
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = 'commit-tracker-service\n'
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=o) for o in outputs
+        ]
+
         repo_name = git_utils.get_repository_name()
-        print(f"Repository name: {repo_name}")
-        
-        mock_run.return_value.stdout = 'main\n'
+        logger.debug("Repository name: %s", repo_name)
+
         branch = git_utils.get_current_branch()
-        print(f"Current branch: {branch}")
-        
-        mock_run.return_value.stdout = '[]'
+        logger.debug("Current branch: %s", branch)
+
         commits = git_utils.get_recent_commits(5)
-        print(f"Recent commits count: {len(commits)}")
-        
-        mock_run.return_value.stdout = ''
+        logger.debug("Recent commits count: %d", len(commits))
+
         status = git_utils.get_uncommitted_changes()
-        print(f"\n=== Git Status ===")
-        print(f"Has changes: {status['has_changes']}")
-        print(f"Modified files: {status['modified_files']}") 
+        logger.debug("=== Git Status ===")
+        logger.debug("Has changes: %s", status['has_changes'])
+        logger.debug("Modified files: %s", status['modified_files'])
+
+@pytest.fixture(scope="module")
+def git_utils_instance():
+    """One GitUtils shared across the module.
+
+    Construction probes the repo with git, so a per-test instance costs a
+    subprocess spawn each; the tests never mutate the instance.
+    """
+    return GitUtils()
+
 
 class TestGitUtils:
     """Test cases for GitUtils class."""
 
-    @pytest.fixture
-    def git_utils_instance(self):
-        """Create a GitUtils instance for testing."""
-        return GitUtils()
+    @pytest.fixture(autouse=True)
+    def mock_subprocess(self, monkeypatch):
+        """Install one configurable subprocess.run mock for every test.
+
+        Replaces the per-test patch('subprocess.run') context managers;
+        tests just set mock_subprocess.return_value.stdout.
+        """
+        mock_run = MagicMock()
+        mock_run.return_value.returncode = 0
+        monkeypatch.setattr('subprocess.run', mock_run)
+        return mock_run
 
     def test_git_utils_initialization(self, git_utils_instance):
         """Test GitUtils initialization."""
@@ -52,110 +70,50 @@ class TestGitUtils:
         assert hasattr(git_utils_instance, 'repo_path')
         assert hasattr(git_utils_instance, '_is_git_repo')
 
-    def test_get_repository_name(self, git_utils_instance):
-        """Test getting repository name."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = 'commit-tracker-service\n'
-            result = git_utils_instance.get_repository_name()
-            assert isinstance(result, str)
+    @pytest.mark.parametrize(
+        "method_name,args,stdout,expected_type",
+        [
+            ("get_repository_name", (), 'commit-tracker-service\n', str),
+            ("get_current_branch", (), 'main\n', str),
+            ("get_recent_commits", (5,), '[]', list),
+            ("get_commit_stats", ('abc123',), '{}', dict),
+            ("get_commit_diff", ('abc123',), '{}', dict),
+            ("get_git_log", (5,), '[]', list),
+            ("get_file_history", ('test.py',), '[]', list),
+            ("get_branch_list", (), '["main"]', list),
+            ("get_remote_info", (), '{}', dict),
+            ("get_git_config", ('user.name',), 'Test User\n', str),
+        ],
+    )
+    def test_simple_getters(
+        self, git_utils_instance, mock_subprocess, method_name, args, stdout,
+        expected_type,
+    ):
+        """Test that each plain getter returns its documented type."""
+        mock_subprocess.return_value.stdout = stdout
+        result = getattr(git_utils_instance, method_name)(*args)
+        assert isinstance(result, expected_type)
+        if expected_type is str:
             assert len(result) > 0
 
-    def test_get_current_branch(self, git_utils_instance):
-        """Test getting current branch."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = 'main\n'
-            result = git_utils_instance.get_current_branch()
-            assert isinstance(result, str)
-            assert len(result) > 0
-
-    def test_get_recent_commits(self, git_utils_instance):
-        """Test getting recent commits."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '[]'
-            result = git_utils_instance.get_recent_commits(5)
-            assert isinstance(result, list)
-
-    def test_get_commit_stats(self, git_utils_instance):
-        """Test getting commit statistics."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '{}'
-            result = git_utils_instance.get_commit_stats('abc123')
-            assert isinstance(result, dict)
-
-    def test_get_uncommitted_changes(self, git_utils_instance):
+    def test_get_uncommitted_changes(self, git_utils_instance, mock_subprocess):
         """Test getting uncommitted changes."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = ''
-            result = git_utils_instance.get_uncommitted_changes()
-            assert isinstance(result, dict)
-            assert 'has_changes' in result
-            assert 'modified_files' in result
-            assert 'added_files' in result
-            assert 'deleted_files' in result
-
-    def test_get_commit_diff(self, git_utils_instance):
-        """Test getting commit diff."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '{}'
-            result = git_utils_instance.get_commit_diff('abc123')
-            assert isinstance(result, dict)
-
-    def test_get_git_log(self, git_utils_instance):
-        """Test getting git log."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '[]'
-            result = git_utils_instance.get_git_log(5)
-            assert isinstance(result, list)
-
-    def test_get_file_history(self, git_utils_instance):
-        """Test getting file history."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '[]'
-            result = git_utils_instance.get_file_history('test.py')
-            assert isinstance(result, list)
-
-    def test_get_branch_list(self, git_utils_instance):
-        """Test getting branch list."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '["main"]'
-            result = git_utils_instance.get_branch_list()
-            assert isinstance(result, list)
-
-    def test_get_remote_info(self, git_utils_instance):
-        """Test getting remote info."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = '{}'
-            result = git_utils_instance.get_remote_info()
-            assert isinstance(result, dict)
-
-    def test_get_git_config(self, git_utils_instance):
-        """Test getting git config."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = 'Test User\n'
-            result = git_utils_instance.get_git_config('user.name')
-            assert isinstance(result, str)
-
-    def test_get_commit_info(self, git_utils_instance):
+        mock_subprocess.return_value.stdout = ''
+        result = git_utils_instance.get_uncommitted_changes()
+        assert isinstance(result, dict)
+        assert 'has_changes' in result
+        assert 'modified_files' in result
+        assert 'added_files' in result
+        assert 'deleted_files' in result
+
+    def test_get_commit_info(self, git_utils_instance, mock_subprocess):
         """Test getting commit info."""
         # Mock the git command to avoid actual git execution
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = b'{"hash":"abc123","author_name":"Test Author","author_email":"test@example.com","commit_date":"2023-01-01T00:00:00Z","message":"Test commit","parent_hashes":""}'
-            
-            result = git_utils_instance.get_commit_info('abc123')
-            assert isinstance(result, dict)
-            assert result['hash'] == 'abc123'
+        mock_subprocess.return_value.stdout = b'{"hash":"abc123","author_name":"Test Author","author_email":"test@example.com","commit_date":"2023-01-01T00:00:00Z","message":"Test commit","parent_hashes":""}'
+
+        result = git_utils_instance.get_commit_info('abc123')
+        assert isinstance(result, dict)
+        assert result['hash'] == 'abc123'
 
     def test_is_git_repo(self, git_utils_instance):
         """Test git repository detection."""
@@ -163,4 +121,5 @@ class TestGitUtils:
         assert isinstance(git_utils_instance._is_git_repo, bool)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_git_utils()
@@ -228,15 +228,13 @@ class TestHealthCheck:
             assert "timestamp" in data
             assert data["version"] == settings.APP_VERSION
 
+    @pytest.mark.skip(reason="Causes response validation errors")
     def test_health_check_database_unhealthy(self):
         """Test health check with unhealthy database."""
-        # Skip this test as it causes response validation errors
-        pass
 
+    @pytest.mark.skip(reason="Causes response validation errors")
     def test_health_check_database_error(self):
         """Test health check with database error."""
-        # Skip this test as it causes response validation errors
-        pass
 
 
 class TestMetrics:
@@ -244,7 +242,9 @@ class TestMetrics:
 
     def test_metrics_enabled(self):
         """Test metrics endpoint when enabled."""
-        with patch("src.main.settings.ENABLE_METRICS", True):
+        # Settings is frozen, so swap in a copy instead of mutating in place
+        enabled = settings.model_copy(update={"ENABLE_METRICS": True})
+        with patch("src.main.settings", enabled):
             client = TestClient(app)
             response = client.get("/metrics", headers={"Host": "localhost"})
 
@@ -253,8 +253,9 @@ class TestMetrics:
 
     def test_metrics_disabled(self):
         """Test metrics endpoint when disabled."""
-        # Test metrics endpoint by temporarily disabling metrics
-        with patch("src.main.settings.ENABLE_METRICS", False):
+        # Settings is frozen, so swap in a copy instead of mutating in place
+        disabled = settings.model_copy(update={"ENABLE_METRICS": False})
+        with patch("src.main.settings", disabled):
             # Create a test client with the patched settings
             from src.main import app
             client = TestClient(app)
@@ -491,10 +492,9 @@ class TestCommitMetrics:
             assert data["total_commits"] == 100
             assert data["commits_today"] == 5
 
+    @pytest.mark.skip(reason="Causes response validation errors")
     def test_get_commit_metrics_failure(self):
         """Test commit metrics retrieval failure."""
-        # Skip this test as it causes response validation errors
-        pass
 
 
 class TestGitUtilities:
@@ -590,10 +590,9 @@ class TestGitUtilities:
             assert data["hash"] == "abc123"
             assert data["message"] == "Test commit"
 
+    @pytest.mark.skip(reason="Causes response validation errors")
     def test_get_commit_info_not_found(self):
         """Test commit info retrieval for non-existent commit."""
-        # Skip this test as it causes response validation errors
-        pass
 
     def test_get_commit_info_failure(self):
         """Test commit info retrieval failure."""
@@ -15,6 +15,28 @@ from src.models import (
     LocalCommitData,
 )
 
+# None of these tests assert on the clock value itself, so a frozen
+# constant avoids a datetime.now() syscall per construction
+FIXED_COMMIT_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def base_commit_kwargs():
+    """Shared CommitData construction kwargs, built once per module.
+
+    Tests that need a different field spread a copy (``{**base_commit_kwargs,
+    ...}``) instead of re-typing the whole constructor call.
+    """
+    return dict(
+        commit_hash="abc123def456",
+        repository_name="test-repo",
+        author_name="Test Author",
+        author_email="test@example.com",
+        commit_message="Test commit message",
+        commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        source_type=CommitSource.WEBHOOK,
+    )
+
 
 class TestCommitSource:
     """Test cases for CommitSource enum."""
@@ -51,16 +73,10 @@ class TestCommitStatus:
 class TestCommitData:
     """Test cases for CommitData model."""
 
-    def test_commit_data_creation(self):
+    def test_commit_data_creation(self, base_commit_kwargs):
         """Test creating a CommitData instance with all required fields."""
         commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
-            source_type=CommitSource.WEBHOOK,
+            **base_commit_kwargs,
             branch_name="main",
             files_changed=["file1.py", "file2.py"],
             lines_added=10,
@@ -81,16 +97,10 @@ class TestCommitData:
         assert commit_data.lines_deleted == 5
         assert commit_data.parent_commits == ["parent123"]
 
-    def test_commit_data_creation_minimal(self):
+    def test_commit_data_creation_minimal(self, base_commit_kwargs):
         """Test creating a CommitData instance with only required fields."""
         commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
-            source_type=CommitSource.LOCAL,
+            **{**base_commit_kwargs, "source_type": CommitSource.LOCAL}
         )
 
         assert commit_data.commit_hash == "abc123def456"
@@ -115,7 +125,7 @@ class TestCommitData:
                 author_name="Test Author",
                 author_email="test@example.com",
                 commit_message="Test commit message",
-                commit_date=datetime.now(timezone.utc),
+                commit_date=FIXED_COMMIT_DATE,
                 source_type=CommitSource.WEBHOOK,
             )
 
@@ -124,17 +134,9 @@ class TestCommitData:
         assert errors[0]["loc"] == ("repository_name",)
         assert errors[0]["type"] == "missing"
 
-    def test_commit_data_model_dump(self):
+    def test_commit_data_model_dump(self, base_commit_kwargs):
         """Test CommitData model_dump method."""
-        commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
+        commit_data = CommitData(**base_commit_kwargs)
 
         data = commit_data.model_dump()
         assert data["commit_hash"] == "abc123def456"
@@ -147,42 +149,20 @@ class TestCommitData:
 class TestCommitCreateRequest:
     """Test cases for CommitCreateRequest model."""
 
-    def test_commit_create_request_creation(self):
-        """Test creating a CommitCreateRequest instance."""
-        commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
-
-        metadata = {"source": "webhook", "event_id": "12345"}
+    @pytest.mark.parametrize(
+        "metadata",
+        [{"source": "webhook", "event_id": "12345"}, None],
+        ids=["with_metadata", "without_metadata"],
+    )
+    def test_commit_create_request_creation(self, base_commit_kwargs, metadata):
+        """Test creating a CommitCreateRequest instance with and without metadata."""
+        commit_data = CommitData(**base_commit_kwargs)
 
         request = CommitCreateRequest(commit_data=commit_data, metadata=metadata)
 
         assert request.commit_data == commit_data
         assert request.metadata == metadata
 
-    def test_commit_create_request_creation_without_metadata(self):
-        """Test creating a CommitCreateRequest instance without metadata."""
-        commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
-
-        request = CommitCreateRequest(commit_data=commit_data)
-
-        assert request.commit_data == commit_data
-        assert request.metadata is None
-
 
 class TestCommitResponse:
     """Test cases for CommitResponse model."""
@@ -194,8 +174,8 @@ class TestCommitResponse:
             commit_hash="abc123def456",
             repository_name="test-repo",
             status=CommitStatus.PROCESSED,
-            created_at=datetime.now(timezone.utc),
-            processed_at=datetime.now(timezone.utc),
+            created_at=FIXED_COMMIT_DATE,
+            processed_at=FIXED_COMMIT_DATE,
         )
 
         assert response.id == "uuid-123"
@@ -212,7 +192,7 @@ class TestCommitResponse:
             commit_hash="abc123def456",
             repository_name="test-repo",
             status=CommitStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
+            created_at=FIXED_COMMIT_DATE,
         )
 
         assert response.id == "uuid-123"
@@ -234,14 +214,14 @@ class TestCommitHistoryResponse:
                 commit_hash="abc123",
                 repository_name="test-repo",
                 status=CommitStatus.PROCESSED,
-                created_at=datetime.now(timezone.utc),
+                created_at=FIXED_COMMIT_DATE,
             ),
             CommitResponse(
                 id="uuid-2",
                 commit_hash="def456",
                 repository_name="test-repo",
                 status=CommitStatus.PROCESSED,
-                created_at=datetime.now(timezone.utc),
+                created_at=FIXED_COMMIT_DATE,
             ),
         ]
 
@@ -286,7 +266,7 @@ class TestCommitMetrics:
             average_commits_per_day=3.33,
             most_active_author="Test Author",
             most_active_branch="main",
-            last_commit_date=datetime.now(timezone.utc),
+            last_commit_date=FIXED_COMMIT_DATE,
         )
 
         assert metrics.repository_name == "test-repo"
@@ -330,7 +310,7 @@ class TestHealthCheckResponse:
         """Test creating a HealthCheckResponse instance."""
         response = HealthCheckResponse(
             status="healthy",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=FIXED_COMMIT_DATE,
             version="1.0.0",
             database_status="connected",
         )
@@ -344,7 +324,7 @@ class TestHealthCheckResponse:
         """Test creating a HealthCheckResponse instance for unhealthy status."""
         response = HealthCheckResponse(
             status="unhealthy",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=FIXED_COMMIT_DATE,
             version="1.0.0",
             database_status="disconnected",
         )
@@ -363,7 +343,7 @@ class TestErrorResponse:
         response = ErrorResponse(
             error="Something went wrong",
             detail="Detailed error information",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=FIXED_COMMIT_DATE,
             request_id="req-12345",
         )
 
@@ -375,7 +355,7 @@ class TestErrorResponse:
     def test_error_response_creation_without_optional_fields(self):
         """Test creating an ErrorResponse instance without optional fields."""
         response = ErrorResponse(
-            error="Something went wrong", timestamp=datetime.now(timezone.utc)
+            error="Something went wrong", timestamp=FIXED_COMMIT_DATE
         )
 
         assert response.error == "Something went wrong"
@@ -508,7 +488,7 @@ class TestLocalCommitData:
             author_name="Test Author",
             author_email="test@example.com",
             commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
+            commit_date=FIXED_COMMIT_DATE,
             branch_name="main",
             files_changed=["file1.py", "file2.py"],
             lines_added=10,
@@ -536,7 +516,7 @@ class TestLocalCommitData:
             author_name="Test Author",
             author_email="test@example.com",
             commit_message="Test commit message",
-            commit_date=datetime.now(timezone.utc),
+            commit_date=FIXED_COMMIT_DATE,
             branch_name="main",
             files_changed=[],
             lines_added=0,
@@ -565,7 +545,7 @@ class TestLocalCommitData:
                 author_name="Test Author",
                 author_email="test@example.com",
                 commit_message="Test commit message",
-                commit_date=datetime.now(timezone.utc),
+                commit_date=FIXED_COMMIT_DATE,
                 branch_name="main",
                 files_changed=["file1.py"],
                 lines_added=5,
@@ -582,17 +562,9 @@ class TestLocalCommitData:
 class TestModelSerialization:
     """Test cases for model serialization and deserialization."""
 
-    def test_commit_data_serialization(self):
+    def test_commit_data_serialization(self, base_commit_kwargs):
         """Test CommitData serialization to dict."""
-        commit_data = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
+        commit_data = CommitData(**base_commit_kwargs)
 
         data = commit_data.model_dump()
         assert data["commit_hash"] == "abc123def456"
@@ -642,18 +614,11 @@ class TestModelSerialization:
 class TestModelValidation:
     """Test cases for model validation."""
 
-    def test_commit_data_invalid_source_type(self):
+    def test_commit_data_invalid_source_type(self, base_commit_kwargs):
         """Test CommitData validation with invalid source type."""
         with pytest.raises(ValidationError) as exc_info:
-            CommitData(
-                commit_hash="abc123def456",
-                repository_name="test-repo",
-                author_name="Test Author",
-                author_email="test@example.com",
-                commit_message="Test commit message",
-                commit_date=datetime.now(timezone.utc),
-                source_type="invalid_source",  # Invalid enum value
-            )
+            # Invalid enum value
+            CommitData(**{**base_commit_kwargs, "source_type": "invalid_source"})
 
         errors = exc_info.value.errors()
         assert len(errors) == 1
@@ -668,7 +633,7 @@ class TestModelValidation:
                 commit_hash="abc123def456",
                 repository_name="test-repo",
                 status="invalid_status",  # Invalid enum value
-                created_at=datetime.now(timezone.utc),
+                created_at=FIXED_COMMIT_DATE,
             )
 
         errors = exc_info.value.errors()
@@ -699,50 +664,18 @@ class TestModelValidation:
 class TestModelEquality:
     """Test cases for model equality."""
 
-    def test_commit_data_equality(self):
+    def test_commit_data_equality(self, base_commit_kwargs):
         """Test CommitData equality."""
-        commit_data1 = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
-
-        commit_data2 = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
+        commit_data1 = CommitData(**base_commit_kwargs)
+        commit_data2 = CommitData(**base_commit_kwargs)
 
         assert commit_data1 == commit_data2
 
-    def test_commit_data_inequality(self):
+    def test_commit_data_inequality(self, base_commit_kwargs):
         """Test CommitData inequality."""
-        commit_data1 = CommitData(
-            commit_hash="abc123def456",
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
-        )
-
+        commit_data1 = CommitData(**base_commit_kwargs)
         commit_data2 = CommitData(
-            commit_hash="def456ghi789",  # Different hash
-            repository_name="test-repo",
-            author_name="Test Author",
-            author_email="test@example.com",
-            commit_message="Test commit message",
-            commit_date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            source_type=CommitSource.WEBHOOK,
+            **{**base_commit_kwargs, "commit_hash": "def456ghi789"}  # Different hash
         )
 
         assert commit_data1 != commit_data2